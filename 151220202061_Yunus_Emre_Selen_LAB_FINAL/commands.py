@@ -1,9 +1,5 @@
 from abc import ABC, abstractmethod
-from processing import (
-    Rgb2GrayProcessor, Rgb2HsvProcessor,
-    MultiOtsuProcessor, ChanVeseProcessor, MorphSnakesProcessor,
-    RobertsProcessor, SobelProcessor, ScharrProcessor, PrewittProcessor
-)
+from collections import deque
 
 class ICommand(ABC):
     """
@@ -36,14 +32,17 @@ class CommandHistory:
     @brief Maintains history of commands for undo and redo operations.
 
     This class stores the stack of executed commands and supports undo/redo operations.
+    Only the most recent commands are kept, since each one may hold an image for undo.
     """
     
-    def __init__(self):
+    def __init__(self, limit=20):
         """
         @brief Initializes the command history with empty stacks.
+
+        @param limit: Maximum number of commands kept; the oldest are dropped first.
         """
-        self._undo_stack = []
-        self._redo_stack = []
+        self._undo_stack = deque(maxlen=limit)
+        self._redo_stack = deque(maxlen=limit)
 
     def push(self, cmd: ICommand):
         """
@@ -80,8 +79,17 @@ class BaseImageCommand(ICommand):
     @brief Base class for image processing commands.
 
     This command operates on images and supports undo functionality by storing 
-    the previous image state.
+    the previous image state. The state is a reference, not a copy, which is safe
+    because image arrays are never modified in place (see ImageProcessor.process).
+
+    Execution is split in two: compute() runs the processor and touches no widgets,
+    so it may run on a worker thread, while execute() shows the cached result and
+    must run on the GUI thread. Redo reuses the cached result.
     """
+
+    ## Name of the processing singleton applied by the command; set by subclasses.
+    ## The processing module (numba, scikit-image) is imported on first use.
+    processor = None
     
     def __init__(self, ctrl):
         """
@@ -90,7 +98,28 @@ class BaseImageCommand(ICommand):
         @param ctrl: The controller that holds the source and output images.
         """
         self.ctrl = ctrl
-        self.prev = ctrl.img_output.copy() if ctrl.img_output is not None else None
+        self.prev = ctrl.img_output
+        self.src = ctrl.img_source
+        self.result = None
+
+    def compute(self):
+        """
+        @brief Applies the processor to the source image, once.
+
+        @return: The processed image.
+        """
+        if self.result is None:
+            import processing
+            self.result = getattr(processing, self.processor).process(self.src)
+        return self.result
+
+    def execute(self):
+        """
+        @brief Shows the processed image as the output image.
+        """
+        out = self.compute()
+        self.ctrl.img_output = out
+        self.ctrl._show_image(out, self.ctrl.lblOutputImage)
 
     def undo(self):
         """
@@ -158,126 +187,63 @@ class GrayscaleCommand(BaseImageCommand):
     """
     @brief Command to convert the source image to grayscale.
     """
-    
-    def execute(self):
-        """
-        @brief Applies grayscale conversion on the source image.
-        """
-        proc = Rgb2GrayProcessor()
-        out = proc.process(self.ctrl.img_source)
-        self.ctrl.img_output = out
-        self.ctrl._show_image(out, self.ctrl.lblOutputImage)
+
+    processor = 'RGB2GRAY'
 
 class HsvCommand(BaseImageCommand):
     """
     @brief Command to convert the source image to HSV.
     """
-    
-    def execute(self):
-        """
-        @brief Applies HSV conversion on the source image.
-        """
-        proc = Rgb2HsvProcessor()
-        out = proc.process(self.ctrl.img_source)
-        self.ctrl.img_output = out
-        self.ctrl._show_image(out, self.ctrl.lblOutputImage)
+
+    processor = 'RGB2HSV'
 
 # Segmentation commands
 class MultiOtsuCommand(BaseImageCommand):
     """
     @brief Command to apply multi-Otsu segmentation on the source image.
     """
-    
-    def execute(self):
-        """
-        @brief Applies multi-Otsu thresholding segmentation on the source image.
-        """
-        proc = MultiOtsuProcessor()
-        out = proc.process(self.ctrl.img_source)
-        self.ctrl.img_output = out
-        self.ctrl._show_image(out, self.ctrl.lblOutputImage)
+
+    processor = 'MULTI_OTSU'
 
 class ChanVeseCommand(BaseImageCommand):
     """
     @brief Command to apply Chan-Vese segmentation on the source image.
     """
-    
-    def execute(self):
-        """
-        @brief Applies Chan-Vese segmentation on the source image.
-        """
-        proc = ChanVeseProcessor()
-        out = proc.process(self.ctrl.img_source)
-        self.ctrl.img_output = out
-        self.ctrl._show_image(out, self.ctrl.lblOutputImage)
+
+    processor = 'CHAN_VESE'
 
 class MorphSnakesCommand(BaseImageCommand):
     """
     @brief Command to apply morphological snakes segmentation on the source image.
     """
-    
-    def execute(self):
-        """
-        @brief Applies morphological snakes segmentation on the source image.
-        """
-        proc = MorphSnakesProcessor()
-        out = proc.process(self.ctrl.img_source)
-        self.ctrl.img_output = out
-        self.ctrl._show_image(out, self.ctrl.lblOutputImage)
+
+    processor = 'MORPH_SNAKES'
 
 # Edge Detection commands
 class RobertsCommand(BaseImageCommand):
     """
     @brief Command to apply Roberts edge detection on the source image.
     """
-    
-    def execute(self):
-        """
-        @brief Applies Roberts edge detection on the source image.
-        """
-        proc = RobertsProcessor()
-        out = proc.process(self.ctrl.img_source)
-        self.ctrl.img_output = out
-        self.ctrl._show_image(out, self.ctrl.lblOutputImage)
+
+    processor = 'ROBERTS'
 
 class SobelCommand(BaseImageCommand):
     """
     @brief Command to apply Sobel edge detection on the source image.
     """
-    
-    def execute(self):
-        """
-        @brief Applies Sobel edge detection on the source image.
-        """
-        proc = SobelProcessor()
-        out = proc.process(self.ctrl.img_source)
-        self.ctrl.img_output = out
-        self.ctrl._show_image(out, self.ctrl.lblOutputImage)
+
+    processor = 'SOBEL'
 
 class ScharrCommand(BaseImageCommand):
     """
     @brief Command to apply Scharr edge detection on the source image.
     """
-    
-    def execute(self):
-        """
-        @brief Applies Scharr edge detection on the source image.
-        """
-        proc = ScharrProcessor()
-        out = proc.process(self.ctrl.img_source)
-        self.ctrl.img_output = out
-        self.ctrl._show_image(out, self.ctrl.lblOutputImage)
+
+    processor = 'SCHARR'
 
 class PrewittCommand(BaseImageCommand):
     """
     @brief Command to apply Prewitt edge detection on the source image.
     """
-    
-    def execute(self):
-        """
-        @brief Applies Prewitt edge detection on the source image.
-        """
-        proc = PrewittProcessor()
-        out = proc.process(self.ctrl.img_source)
-        self.ctrl.img_output = out
-        self.ctrl._show_image(out, self.ctrl.lblOutputImage)
+
+    processor = 'PREWITT'
@@ -1,4 +1,11 @@
+import os
 import sys
+
+# The GUI runs the numba kernels on its command worker thread. With the TBB layer
+# that leaves the interpreter hanging at exit; workqueue is safe since the runner
+# pool in ui.py has a single thread. Must be set before numba is imported.
+os.environ.setdefault('NUMBA_THREADING_LAYER', 'workqueue')
+
 from PyQt5.QtWidgets import QApplication
 from ui import MainWindowController
 
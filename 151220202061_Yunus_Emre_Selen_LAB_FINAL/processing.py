@@ -1,7 +1,94 @@
+import weakref
 import numpy as np
-from skimage import color, filters
-from skimage.filters import threshold_otsu, threshold_multiotsu
-from skimage.segmentation import chan_vese, morphological_chan_vese
+from numba import njit, prange
+from skimage.segmentation import morphological_chan_vese
+from skimage.util import img_as_ubyte
+
+# Optional GPU backend: cuCIM mirrors the skimage API on CuPy arrays
+try:
+    import cupy as cp
+    import cupyx.scipy.ndimage as cundi
+    from cucim.skimage.segmentation import (
+        chan_vese as cu_chan_vese,
+        morphological_chan_vese as cu_morphological_chan_vese
+    )
+    _HAS_GPU = cp.cuda.runtime.getDeviceCount() > 0
+except (ImportError, RuntimeError):
+    cp = None
+    _HAS_GPU = False
+
+# Below this many pixels the host <-> device transfers outweigh the speedup
+_GPU_MIN_PIXELS = 512 * 512
+
+
+def _use_gpu(image):
+    """
+    @brief Decides whether an image should be processed on the GPU.
+
+    @param image: The image about to be processed.
+    @return: True if a CUDA device is available and the image is large enough.
+    """
+    return _HAS_GPU and image.size >= _GPU_MIN_PIXELS
+
+
+def _rgb2gray_u8(image):
+    """
+    @brief Converts an RGB image to uint8 grayscale with integer arithmetic.
+
+    Uses the BT.601 luma weights in 8-bit fixed point (77, 150, 29) / 256,
+    so the whole conversion runs in uint16 and never materializes a float
+    copy of the image.
+
+    @param image: The input RGB (or RGBA) image.
+    @return: The uint8 grayscale image.
+    """
+    image = img_as_ubyte(image)
+    # 77 + 150 + 29 == 256, so 255 * 256 + 128 still fits in uint16
+    r = image[..., 0].astype(np.uint16)
+    g = image[..., 1].astype(np.uint16)
+    b = image[..., 2].astype(np.uint16)
+    return ((77 * r + 150 * g + 29 * b + 128) >> 8).astype(np.uint8)
+
+
+# Grayscale version of the last color image converted, keyed on the identity
+# of that image. Chaining several processors on one source converts it once.
+_gray_cache = (None, None)
+
+
+def _drop_gray_cache(ref):
+    """
+    @brief Clears the grayscale cache once its source image is released.
+
+    @param ref: The dead weak reference to the source image.
+    """
+    global _gray_cache
+    if _gray_cache[0] is ref:
+        _gray_cache = (None, None)
+
+
+def _to_gray_u8(image):
+    """
+    @brief Returns the uint8 grayscale version of an image.
+
+    Every processor that works on intensities goes through this helper, so the
+    conversion is implemented once. The last color conversion is cached with a
+    weak reference to the source array, so it is invalidated as soon as another
+    image is passed in or the source is released, and a new array can never
+    match a stale entry.
+
+    @param image: The input image, color or grayscale.
+    @return: The uint8 grayscale image.
+    """
+    global _gray_cache
+    if image.ndim != 3:
+        return img_as_ubyte(image)
+    ref, gray = _gray_cache
+    if ref is not None and ref() is image:
+        return gray
+    gray = _rgb2gray_u8(image)
+    _gray_cache = (weakref.ref(image, _drop_gray_cache), gray)
+    return gray
+
 
 class ImageProcessor:
     """
@@ -15,7 +102,11 @@ class ImageProcessor:
         @brief Processes an image.
 
         This method is abstract and must be implemented by subclasses to process
-        the image according to the desired functionality.
+        the image according to the desired functionality. Implementations never
+        modify the input in place. The returned array must be treated as read-only
+        as well, since it may be the input itself or a cached conversion; commands
+        rely on this to keep undo snapshots by reference. The result is always
+        uint8, so it can be displayed without another conversion.
 
         @param image: The input image to be processed.
         @return: The processed image.
@@ -36,10 +127,13 @@ class Rgb2GrayProcessor(ImageProcessor):
         """
         @brief Converts an RGB image to grayscale.
 
+        Uses the BT.601 fixed-point kernel shared with the other processors.
+        Images that are already single channel are only converted to uint8.
+
         @param image: The input RGB image.
         @return: The grayscale image.
         """
-        return (color.rgb2gray(image) * 255).astype(np.uint8)
+        return _to_gray_u8(image)
 
 
 class Rgb2HsvProcessor(ImageProcessor):
@@ -53,39 +147,210 @@ class Rgb2HsvProcessor(ImageProcessor):
         """
         @brief Converts an RGB image to HSV.
 
+        All three channels are computed with integer arithmetic on the uint8
+        input and scaled to the 0–255 range, so no float copy of the image is
+        made. Pixels without chroma (max == min) get a hue and saturation of 0.
+        Images that are not three-channel are only converted to uint8.
+
         @param image: The input RGB image.
         @return: The HSV image.
         """
+        image = img_as_ubyte(image)
         if image.ndim != 3 or image.shape[2] != 3:
             return image
-        hsv = color.rgb2hsv(image)
-        return (hsv * 255).astype(np.uint8)
+        r = image[..., 0].astype(np.int32)
+        g = image[..., 1].astype(np.int32)
+        b = image[..., 2].astype(np.int32)
+        cmax = image.max(axis=2).astype(np.int32)
+        cmin = image.min(axis=2).astype(np.int32)
+        delta = cmax - cmin
+        # Gray pixels (no chroma) keep H = S = 0; their divisions are skipped
+        chroma = delta != 0
+
+        # Hue as a fraction of a turn, num / (6 * delta), picking the sector
+        # by the channel holding the maximum; quantized to 0–255 in one step
+        num = np.where(cmax == r, g - b,
+              np.where(cmax == g, 2 * delta + b - r,
+                                  4 * delta + r - g))
+        num = np.where(num < 0, num + 6 * delta, num)
+        h = np.zeros_like(delta)
+        np.floor_divide(num * 255, 6 * delta, out=h, where=chroma)
+        s = np.zeros_like(delta)
+        np.floor_divide(delta * 255, cmax, out=s, where=chroma)
+        return np.stack([h, s, cmax], axis=-1).astype(np.uint8)
 
 
 # --- Segmentation ---
+@njit(cache=True)
+def _multiotsu_256(hist):
+    """
+    @brief Finds the two Multi-Otsu thresholds of a 256-bin histogram.
+
+    Exhaustively scans every pair of split points (t1 < t2) and keeps the one
+    maximizing the between-class variance, evaluated in O(1) per pair from
+    prefix sums of the histogram.
+
+    @param hist: The 256-bin histogram of a uint8 image.
+    @return: The thresholds (t1, t2); classes are [0, t1], (t1, t2] and (t2, 255].
+    """
+    weight = np.zeros(257)
+    mass = np.zeros(257)
+    for k in range(256):
+        weight[k + 1] = weight[k] + hist[k]
+        mass[k + 1] = mass[k] + k * hist[k]
+
+    best = -1.0
+    best_t1 = 0
+    best_t2 = 1
+    for t1 in range(254):
+        w0 = weight[t1 + 1]
+        m0 = mass[t1 + 1]
+        s0 = m0 * m0 / w0 if w0 > 0 else 0.0
+        for t2 in range(t1 + 1, 255):
+            w1 = weight[t2 + 1] - w0
+            m1 = mass[t2 + 1] - m0
+            w2 = weight[256] - weight[t2 + 1]
+            m2 = mass[256] - mass[t2 + 1]
+            score = s0
+            if w1 > 0:
+                score += m1 * m1 / w1
+            if w2 > 0:
+                score += m2 * m2 / w2
+            if score > best:
+                best = score
+                best_t1 = t1
+                best_t2 = t2
+    return best_t1, best_t2
+
+
 class MultiOtsuProcessor(ImageProcessor):
     """
     @brief Performs Multi-Otsu thresholding for segmentation.
 
     This processor segments an image into multiple regions using the Multi-Otsu method.
     """
+
+    # Output gray level of each of the 3 classes
+    _LEVELS = np.array([0, 127, 255], dtype=np.uint8)
     
     def process(self, image):
         """
         @brief Segments the image using Multi-Otsu thresholding.
 
         This method converts the image to grayscale and applies Multi-Otsu thresholding
-        to segment the image into 3 regions.
+        to segment the image into 3 regions. The thresholds are searched on the
+        256-bin histogram of the uint8 grayscale image.
 
         @param image: The input image.
         @return: The segmented image.
         """
         # Convert to grayscale and calculate thresholds for 3 classes
-        gray = color.rgb2gray(image) if image.ndim == 3 else image
-        thresholds = threshold_multiotsu(gray, classes=3)
-        result = np.digitize(gray, bins=thresholds)
-        # Scale to 0–255 range
-        return (result * (255 // result.max())).astype(np.uint8)
+        gray = _to_gray_u8(image)
+        hist = np.bincount(gray.ravel(), minlength=256)
+        thresholds = np.array(_multiotsu_256(hist), dtype=np.uint8)
+        # Label with the split the thresholds were optimized for: [0, t1], (t1, t2], (t2, 255]
+        result = np.searchsorted(thresholds, gray, side='left')
+        # Map the class labels to 0–255 with a single gather
+        return self._LEVELS[result]
+
+
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _chanvese_step(image, phi, new_phi, c1, c2, mu, lambda1, lambda2, dt):
+    """
+    @brief Performs one semi-implicit Chan-Vese update of the level set.
+
+    This is equation (22) of Getreuer's Chan-Vese paper, the same update as
+    skimage.segmentation.chan_vese, with edge padding done by clamping. The
+    squared change of the level set and the sums needed for the next region
+    averages are accumulated in the same pass.
+
+    @param image: The normalized float image.
+    @param phi: The current level set.
+    @param new_phi: Output array for the updated level set.
+    @param c1: Average intensity inside the contour (phi > 0).
+    @param c2: Average intensity outside the contour.
+    @param mu: Edge length weight.
+    @param lambda1: Weight of the inside difference-from-average term.
+    @param lambda2: Weight of the outside difference-from-average term.
+    @param dt: Time step.
+    @return: (sum of squared changes, intensity sum inside, pixel count inside)
+             for the updated level set.
+    """
+    eta = 1e-16
+    h, w = phi.shape
+    change = 0.0
+    inside_sum = 0.0
+    inside_count = 0
+    for i in prange(h):
+        up = max(i - 1, 0)
+        down = min(i + 1, h - 1)
+        for j in range(w):
+            left = max(j - 1, 0)
+            right = min(j + 1, w - 1)
+            p = phi[i, j]
+            pl = phi[i, left]
+            pr = phi[i, right]
+            pu = phi[up, j]
+            pd = phi[down, j]
+            phix0 = (pr - pl) / 2.0
+            phiy0 = (pd - pu) / 2.0
+            k1 = 1.0 / np.sqrt(eta + (pr - p) ** 2 + phiy0 ** 2)
+            k2 = 1.0 / np.sqrt(eta + (p - pl) ** 2 + phiy0 ** 2)
+            k3 = 1.0 / np.sqrt(eta + phix0 ** 2 + (pd - p) ** 2)
+            k4 = 1.0 / np.sqrt(eta + phix0 ** 2 + (p - pu) ** 2)
+            curvature = pr * k1 + pl * k2 + pd * k3 + pu * k4
+            v = image[i, j]
+            fit = -lambda1 * (v - c1) ** 2 + lambda2 * (v - c2) ** 2
+            step = dt / (1.0 + p * p)
+            q = (p + step * (mu * curvature + fit)) / (1.0 + mu * step * (k1 + k2 + k3 + k4))
+            new_phi[i, j] = q
+            change += (q - p) ** 2
+            if q > 0:
+                inside_sum += v
+                inside_count += 1
+    return change, inside_sum, inside_count
+
+
+def _chan_vese_cpu(gray, mu, lambda1, lambda2, tol, max_num_iter, dt=0.5):
+    """
+    @brief Chan-Vese segmentation on the CPU using the parallel numba update.
+
+    Mirrors skimage.segmentation.chan_vese with the checkerboard starting level
+    set: the image is normalized to [0, 1] and the level set is evolved until its
+    RMS change drops to tol or max_num_iter is reached.
+
+    @param gray: The 2D grayscale image.
+    @param mu: Edge length weight.
+    @param lambda1: Weight of the inside difference-from-average term.
+    @param lambda2: Weight of the outside difference-from-average term.
+    @param tol: Level set variation tolerance between iterations.
+    @param max_num_iter: Maximum number of iterations.
+    @param dt: Time step.
+    @return: The boolean segmentation (phi > 0).
+    """
+    image = gray.astype(np.float64)
+    image -= image.min()
+    if image.max() != 0:
+        image /= image.max()
+    h, w = image.shape
+    # Checkerboard level set sin(pi y / 5) sin(pi x / 5)
+    phi = np.sin(np.arange(h) * (np.pi / 5))[:, None] * np.sin(np.arange(w) * (np.pi / 5))
+    new_phi = np.empty_like(phi)
+
+    total_sum = image.sum()
+    inside = phi > 0
+    inside_sum = image[inside].sum()
+    inside_count = np.count_nonzero(inside)
+    for _ in range(max_num_iter):
+        outside_count = image.size - inside_count
+        c1 = inside_sum / inside_count if inside_count else 0.0
+        c2 = (total_sum - inside_sum) / outside_count if outside_count else 0.0
+        change, inside_sum, inside_count = _chanvese_step(
+            image, phi, new_phi, c1, c2, mu, lambda1, lambda2, dt)
+        phi, new_phi = new_phi, phi
+        if np.sqrt(change / image.size) <= tol:
+            break
+    return phi > 0
 
 
 class ChanVeseProcessor(ImageProcessor):
@@ -95,27 +360,32 @@ class ChanVeseProcessor(ImageProcessor):
     This processor segments the image using the Chan-Vese method, which is an active contour
     model for image segmentation.
     """
+
+    # Classic Chan-Vese parameters, shared by the CPU and GPU paths
+    _PARAMS = dict(
+        mu=0.25,
+        lambda1=1,
+        lambda2=1,
+        tol=1e-3,
+        max_num_iter=200
+    )
     
     def process(self, image):
         """
         @brief Segments the image using the Chan-Vese method.
 
         This method applies the Chan-Vese algorithm to segment the image into regions.
+        Large images are segmented with cuCIM on the GPU when CuPy and a CUDA
+        device are available, and with the multi-threaded numba port otherwise.
 
         @param image: The input image.
         @return: The segmented image.
         """
-        gray = color.rgb2gray(image) if image.ndim == 3 else image
-        # Classic Chan-Vese segmentation
-        mask = chan_vese(
-            gray,
-            mu=0.25,
-            lambda1=1,
-            lambda2=1,
-            tol=1e-3,
-            max_num_iter=200,
-            extended_output=False
-        )
+        gray = _to_gray_u8(image)
+        if _use_gpu(gray):
+            mask = cp.asnumpy(cu_chan_vese(cp.asarray(gray), **self._PARAMS))
+        else:
+            mask = _chan_vese_cpu(gray, **self._PARAMS)
         return (mask.astype(np.uint8) * 255)
 
 
@@ -130,35 +400,173 @@ class MorphSnakesProcessor(ImageProcessor):
         """
         @brief Segments the image using morphological snakes.
 
-        This method applies morphological snakes to segment the image.
+        This method applies morphological snakes to segment the image, on the
+        GPU through cuCIM for large images when CUDA is available.
 
         @param image: The input image.
         @return: The segmented image.
         """
-        gray = color.rgb2gray(image) if image.ndim == 3 else image
+        gray = _to_gray_u8(image)
         # Morphological snakes (morphological_chan_vese)
-        mask = morphological_chan_vese(gray, num_iter=50)
+        if _use_gpu(gray):
+            mask = cp.asnumpy(cu_morphological_chan_vese(cp.asarray(gray), num_iter=50))
+        else:
+            mask = morphological_chan_vese(gray, num_iter=50)
         return (mask.astype(np.uint8) * 255)
 
 
 # --- Edge Detection with emphasize ---
+# Edge kernels hand out bands of _TILE full-width rows to the threads, so each
+# thread streams through a contiguous block and the three rows feeding the
+# current output row (the stencil's halo) are still cached from the last one.
+_TILE = 256
+
+
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _gradient_3x3(gray, side, center):
+    """
+    @brief Computes the gradient magnitude of a 3x3 derivative kernel pair.
+
+    The horizontal and vertical kernels are the separable product of a central
+    difference and a smoothing vector (side, center, side), which covers Sobel
+    (1, 2), Prewitt (1, 1) and Scharr (3, 10). Both responses and the magnitude
+    are computed in a single float32 pass; borders are handled by clamping,
+    which is equivalent to mirror padding for a one pixel halo. Rows are
+    processed in bands of _TILE distributed across threads.
+
+    @param gray: The 2D input image.
+    @param side: Smoothing weight of the outer taps.
+    @param center: Smoothing weight of the middle tap.
+    @return: The float32 gradient magnitude.
+    """
+    h, w = gray.shape
+    side = np.float32(side)
+    center = np.float32(center)
+    out = np.empty((h, w), dtype=np.float32)
+    for band in prange((h + _TILE - 1) // _TILE):
+        for i in range(band * _TILE, min((band + 1) * _TILE, h)):
+            up = max(i - 1, 0)
+            down = min(i + 1, h - 1)
+            for j in range(w):
+                left = max(j - 1, 0)
+                right = min(j + 1, w - 1)
+                gx = (side * (np.float32(gray[up, right]) - np.float32(gray[up, left]))
+                      + center * (np.float32(gray[i, right]) - np.float32(gray[i, left]))
+                      + side * (np.float32(gray[down, right]) - np.float32(gray[down, left])))
+                gy = (side * (np.float32(gray[down, left]) - np.float32(gray[up, left]))
+                      + center * (np.float32(gray[down, j]) - np.float32(gray[up, j]))
+                      + side * (np.float32(gray[down, right]) - np.float32(gray[up, right])))
+                out[i, j] = np.sqrt(gx * gx + gy * gy)
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _gradient_roberts(gray):
+    """
+    @brief Computes the Roberts cross gradient magnitude.
+
+    @param gray: The 2D input image.
+    @return: The float32 gradient magnitude.
+    """
+    h, w = gray.shape
+    out = np.empty((h, w), dtype=np.float32)
+    for band in prange((h + _TILE - 1) // _TILE):
+        for i in range(band * _TILE, min((band + 1) * _TILE, h)):
+            down = min(i + 1, h - 1)
+            for j in range(w):
+                right = min(j + 1, w - 1)
+                gp = np.float32(gray[i, j]) - np.float32(gray[down, right])
+                gn = np.float32(gray[i, right]) - np.float32(gray[down, j])
+                out[i, j] = np.sqrt(gp * gp + gn * gn)
+    return out
+
+
+@njit(cache=True)
+def _otsu_256(hist):
+    """
+    @brief Finds the Otsu threshold of a 256-bin histogram over [0, 1].
+
+    Scans the 255 split points for the maximum between-class variance. Bins and
+    the returned bin center follow skimage.filters.threshold_otsu.
+
+    @param hist: The 256-bin histogram.
+    @return: The threshold, as the center of the last bin of the lower class.
+    """
+    total = 0.0
+    total_mass = 0.0
+    for k in range(256):
+        total += hist[k]
+        total_mass += hist[k] * (k + 0.5) / 256
+    best = -1.0
+    thr = 0.5 / 256
+    weight1 = 0.0
+    mass1 = 0.0
+    for k in range(255):
+        weight1 += hist[k]
+        mass1 += hist[k] * (k + 0.5) / 256
+        weight2 = total - weight1
+        if weight1 == 0 or weight2 == 0:
+            continue
+        diff = mass1 / weight1 - (total_mass - mass1) / weight2
+        variance = weight1 * weight2 * diff * diff
+        if variance > best:
+            best = variance
+            thr = (k + 0.5) / 256
+    return thr
+
+
+# No 'arcp': the stretch must map the maximum response to exactly 255
+@njit(parallel=True, fastmath={'nnan', 'ninf', 'nsz', 'contract', 'reassoc'}, cache=True, nogil=True)
 def _edge_emphasize(res):
     """
     @brief Emphasizes edges in the image.
 
     This function performs edge enhancement by normalizing the result and applying
-    Otsu's thresholding.
+    Otsu's thresholding. The min/max sweep, the 256-bin Otsu histogram and the
+    final stretch to uint8 are fused into three passes over the response, with
+    no temporary images.
 
     @param res: The image or edge response to be enhanced.
     @return: The enhanced edge image.
     """
-    res = res - res.min()
-    if res.max() > 0:
-        res /= res.max()
-    thr = threshold_otsu(res)
-    out = (res - thr) / (1 - thr) if (1 - thr) > 0 else res
-    out = np.clip(out, 0, 1)
-    return (out * 255).astype(np.uint8)
+    h, w = res.shape
+    out = np.zeros((h, w), dtype=np.uint8)
+
+    # Everything per pixel stays in the float32 precision of the response
+    lo = res[0, 0]
+    hi = res[0, 0]
+    for i in prange(h):
+        for j in range(w):
+            v = res[i, j]
+            lo = min(lo, v)
+            hi = max(hi, v)
+    if hi <= lo:
+        return out
+    span = hi - lo
+    scale = np.float32(256) / span
+
+    # Per-block histograms of the normalized response, merged afterwards
+    nblocks = min(h, 64)
+    rows = (h + nblocks - 1) // nblocks
+    partial = np.zeros((nblocks, 256), dtype=np.int64)
+    for blk in prange(nblocks):
+        for i in range(blk * rows, min(h, (blk + 1) * rows)):
+            for j in range(w):
+                k = int((res[i, j] - lo) * scale)
+                partial[blk, min(k, 255)] += 1
+    hist = partial.sum(axis=0)
+
+    thr = np.float32(_otsu_256(hist))
+    keep = np.float32(1) - thr
+    if keep <= 0:
+        thr = np.float32(0)
+        keep = np.float32(1)
+    # Branchless stretch: clamp in float (maxps/minps) before truncating to uint8
+    for i in prange(h):
+        for j in range(w):
+            v = ((res[i, j] - lo) / span - thr) / keep * np.float32(255)
+            out[i, j] = np.uint8(min(max(v, np.float32(0)), np.float32(255)))
+    return out
 
 
 class RobertsProcessor(ImageProcessor):
@@ -175,8 +583,8 @@ class RobertsProcessor(ImageProcessor):
         @param image: The input image.
         @return: The edge-detected image using the Roberts filter.
         """
-        gray = color.rgb2gray(image) if image.ndim == 3 else image
-        res = filters.roberts(gray)
+        gray = _to_gray_u8(image)
+        res = _gradient_roberts(gray)
         return _edge_emphasize(res)
 
 
@@ -191,11 +599,17 @@ class SobelProcessor(ImageProcessor):
         """
         @brief Applies Sobel edge detection.
 
+        Large images are filtered on the GPU with CuPy when CUDA is available.
+
         @param image: The input image.
         @return: The edge-detected image using the Sobel filter.
         """
-        gray = color.rgb2gray(image) if image.ndim == 3 else image
-        res = filters.sobel(gray)
+        gray = _to_gray_u8(image)
+        if _use_gpu(gray):
+            g = cp.asarray(gray, dtype=cp.float32)
+            res = cp.asnumpy(cp.hypot(cundi.sobel(g, axis=0), cundi.sobel(g, axis=1)))
+        else:
+            res = _gradient_3x3(gray, 1, 2)
         return _edge_emphasize(res)
 
 
@@ -213,8 +627,8 @@ class ScharrProcessor(ImageProcessor):
         @param image: The input image.
         @return: The edge-detected image using the Scharr filter.
         """
-        gray = color.rgb2gray(image) if image.ndim == 3 else image
-        res = filters.scharr(gray)
+        gray = _to_gray_u8(image)
+        res = _gradient_3x3(gray, 3, 10)
         return _edge_emphasize(res)
 
 
@@ -232,6 +646,20 @@ class PrewittProcessor(ImageProcessor):
         @param image: The input image.
         @return: The edge-detected image using the Prewitt filter.
         """
-        gray = color.rgb2gray(image) if image.ndim == 3 else image
-        res = filters.prewitt(gray)
+        gray = _to_gray_u8(image)
+        res = _gradient_3x3(gray, 1, 1)
         return _edge_emphasize(res)
+
+
+# --- Shared instances ---
+# Processors carry no per-call state, so commands reuse these instead of
+# constructing a new processor on every execution.
+RGB2GRAY = Rgb2GrayProcessor()
+RGB2HSV = Rgb2HsvProcessor()
+MULTI_OTSU = MultiOtsuProcessor()
+CHAN_VESE = ChanVeseProcessor()
+MORPH_SNAKES = MorphSnakesProcessor()
+ROBERTS = RobertsProcessor()
+SOBEL = SobelProcessor()
+SCHARR = ScharrProcessor()
+PREWITT = PrewittProcessor()
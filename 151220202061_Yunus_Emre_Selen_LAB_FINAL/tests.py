@@ -1,8 +1,19 @@
+import os
+import subprocess
+import sys
 import unittest
 import numpy as np
-from processing import Rgb2GrayProcessor, MultiOtsuProcessor
-from commands import CommandHistory, GrayscaleCommand, ClearSourceCommand
+from skimage.filters import threshold_otsu
+from skimage.segmentation import chan_vese
+import processing
+from processing import (
+    Rgb2GrayProcessor, Rgb2HsvProcessor, MultiOtsuProcessor,
+    RobertsProcessor, SobelProcessor, ScharrProcessor, PrewittProcessor,
+    _otsu_256, _multiotsu_256, _chan_vese_cpu
+)
+from commands import ICommand, CommandHistory, GrayscaleCommand, ClearSourceCommand
 from utils import open_image
+from ui import _downscale_for_display, _MAX_DISPLAY_DIM
 
 class TestProcessing(unittest.TestCase):
     """
@@ -22,6 +33,45 @@ class TestProcessing(unittest.TestCase):
         self.assertEqual(gray.shape, (3,3))
         self.assertTrue((gray == 128).all())
 
+    def test_rgb2gray_weights(self):
+        """
+        @brief Tests the BT.601 fixed-point weights of the grayscale kernel.
+        """
+        rgb = np.zeros((1,3,3), dtype=np.uint8)
+        rgb[0,0,0] = rgb[0,1,1] = rgb[0,2,2] = 255
+        gray = Rgb2GrayProcessor().process(rgb)
+        self.assertEqual(gray.dtype, np.uint8)
+        self.assertEqual(gray.tolist(), [[77, 149, 29]])
+
+    def test_rgb2hsv(self):
+        """
+        @brief Tests conversion from RGB to HSV on primaries and a gray pixel.
+        """
+        rgb = np.array([[[255,0,0], [0,255,0], [0,0,255], [128,128,128]]], dtype=np.uint8)
+        hsv = Rgb2HsvProcessor().process(rgb)
+        self.assertEqual(hsv.dtype, np.uint8)
+        self.assertEqual(hsv.tolist(), [[[0,255,255], [85,255,255], [170,255,255], [0,0,128]]])
+
+    def test_gray_cache_released_with_source(self):
+        """
+        @brief Tests that the cached grayscale image is dropped when its source is released.
+        """
+        rgb = np.ones((4,4,3), dtype=np.uint8)
+        Rgb2GrayProcessor().process(rgb)
+        self.assertIsNotNone(processing._gray_cache[1])
+        del rgb
+        self.assertEqual(processing._gray_cache, (None, None))
+
+    def test_outputs_are_uint8(self):
+        """
+        @brief Tests that conversions of images they pass through still return uint8.
+        """
+        gray16 = np.full((3,3), 32896, dtype=np.uint16)
+        for proc in (Rgb2GrayProcessor(), Rgb2HsvProcessor()):
+            out = proc.process(gray16)
+            self.assertEqual(out.dtype, np.uint8)
+            self.assertTrue((out == 128).all())
+
     def test_multiotsu(self):
         """
         @brief Tests multi-Otsu segmentation.
@@ -29,3 +79,125 @@ class TestProcessing(unittest.TestCase):
         gray = Rgb2GrayProcessor().process(self.rgb)
         seg  = MultiOtsuProcessor().process(gray)
         self.assertTrue((seg == seg[0,0]).all())
+
+    def test_multiotsu_threshold_pixels(self):
+        """
+        @brief Tests that pixels equal to a threshold get the class below it.
+        """
+        gray = np.arange(256, dtype=np.uint8).reshape(16, 16)
+        t1, t2 = _multiotsu_256(np.bincount(gray.ravel(), minlength=256))
+        seg = MultiOtsuProcessor().process(gray)
+        self.assertTrue((seg[gray <= t1] == 0).all())
+        self.assertTrue((seg[(gray > t1) & (gray <= t2)] == 127).all())
+        self.assertTrue((seg[gray > t2] == 255).all())
+        self.assertEqual(seg[gray == t1].tolist(), [0])
+        self.assertEqual(seg[gray == t2].tolist(), [127])
+
+    def test_edges_step(self):
+        """
+        @brief Tests that every edge detector fires only along a vertical step.
+        """
+        step = np.zeros((8,8), dtype=np.uint8)
+        step[:, 4:] = 255
+        for proc in (RobertsProcessor(), SobelProcessor(), ScharrProcessor(), PrewittProcessor()):
+            edges = proc.process(step)
+            self.assertEqual(edges.shape, step.shape)
+            self.assertEqual(edges.dtype, np.uint8)
+            self.assertTrue((edges[:, 3:5].max(axis=1) == 255).all())
+            self.assertTrue((edges[:, :2] == 0).all())
+            self.assertTrue((edges[:, 6:] == 0).all())
+
+    def test_otsu_256_matches_skimage(self):
+        """
+        @brief Tests the histogram Otsu scan against skimage's threshold_otsu.
+        """
+        rng = np.random.default_rng(0)
+        x = np.concatenate([rng.normal(0.3, 0.05, 5000), rng.normal(0.6, 0.1, 3000)])
+        x = np.clip(x, 0, 1)
+        x[:2] = 0, 1
+        hist = np.bincount(np.minimum((x * 256).astype(int), 255), minlength=256)
+        self.assertAlmostEqual(_otsu_256(hist), threshold_otsu(x))
+
+    def test_chan_vese_matches_skimage(self):
+        """
+        @brief Tests the numba Chan-Vese port against skimage's chan_vese.
+        """
+        rng = np.random.default_rng(0)
+        img = rng.normal(60, 20, (48,64))
+        img[12:36, 16:48] += 120
+        img = np.clip(img, 0, 255).astype(np.uint8)
+        params = dict(mu=0.25, lambda1=1, lambda2=1, tol=1e-3, max_num_iter=200)
+        expected = chan_vese(img, **params)
+        self.assertTrue((_chan_vese_cpu(img, **params) == expected).all())
+
+
+class TestCommandHistory(unittest.TestCase):
+    """
+    @brief Tests for the undo/redo command history.
+    """
+    class _Step(ICommand):
+        """
+        @brief Command appending its id to a shared log.
+        """
+        def __init__(self, log, n):
+            self.log, self.n = log, n
+        def execute(self):
+            self.log.append(self.n)
+        def undo(self):
+            self.log.remove(self.n)
+
+    def test_history_is_bounded(self):
+        """
+        @brief Tests that only the most recent commands can be undone.
+        """
+        log = []
+        history = CommandHistory(limit=3)
+        for n in range(5):
+            cmd = self._Step(log, n)
+            cmd.execute()
+            history.push(cmd)
+        for _ in range(5):
+            history.undo()
+        self.assertEqual(log, [0, 1])
+        history.redo()
+        self.assertEqual(log, [0, 1, 2])
+
+class TestDisplay(unittest.TestCase):
+    """
+    @brief Tests for preparing images for display.
+    """
+
+    def test_downscale_thin_strip(self):
+        """
+        @brief Tests that downscaling keeps at least one pixel on the short side.
+        """
+        for shape in ((1, 4097), (4097, 1, 3), (3, 10000)):
+            small = _downscale_for_display(np.zeros(shape, dtype=np.uint8))
+            self.assertEqual(max(small.shape[:2]), _MAX_DISPLAY_DIM)
+            self.assertGreaterEqual(min(small.shape[:2]), 1)
+        img = np.zeros((100, 200), dtype=np.uint8)
+        self.assertIs(_downscale_for_display(img), img)
+
+class TestWorkerThread(unittest.TestCase):
+    """
+    @brief Tests for running processing commands off the main thread.
+    """
+
+    def test_worker_thread_compute_exits(self):
+        """
+        @brief Tests that the application still exits after a command is computed on a worker thread.
+        """
+        script = (
+            "import main, threading, types, numpy as np\n"
+            "from commands import SobelCommand\n"
+            "img = np.random.randint(0, 256, (64, 80, 3), np.uint8)\n"
+            "cmd = SobelCommand(types.SimpleNamespace(img_source=img, img_output=None))\n"
+            "worker = threading.Thread(target=cmd.compute)\n"
+            "worker.start(); worker.join()\n"
+        )
+        env = {k: v for k, v in os.environ.items() if k != 'NUMBA_THREADING_LAYER'}
+        proc = subprocess.run(
+            [sys.executable, '-c', script], cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=env, timeout=120, capture_output=True
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr.decode())
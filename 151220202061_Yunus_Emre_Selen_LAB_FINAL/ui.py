@@ -1,7 +1,10 @@
 import os
+import re
+from collections import deque
+import cv2
 import numpy as np
 from PyQt5 import QtCore
-from PyQt5.QtWidgets import QMainWindow, QFileDialog, QSizePolicy
+from PyQt5.QtWidgets import QMainWindow, QFileDialog, QSizePolicy, QActionGroup
 from PyQt5.QtGui import QPixmap, QImage
 from qt_design import Ui_MainWindow
 from utils import open_image, save_image, export_image, show_error
@@ -20,6 +23,63 @@ from commands import (
     PrewittCommand
 )
 
+# Longest side, in pixels, of the pixmaps built for display; larger images are downscaled
+_MAX_DISPLAY_DIM = 2048
+
+def _downscale_for_display(img):
+    """
+    @brief Shrinks an image so that its longest side fits _MAX_DISPLAY_DIM.
+
+    The target size is passed explicitly and each side is kept at least one pixel,
+    so thin strips do not collapse to an empty size.
+
+    @param img: The uint8 image to be displayed.
+    @return: The image itself if it already fits, else a downscaled copy.
+    """
+    h, w = img.shape[:2]
+    longest = max(h, w)
+    if longest <= _MAX_DISPLAY_DIM:
+        return img
+    scale = _MAX_DISPLAY_DIM / longest
+    dsize = (max(1, round(w * scale)), max(1, round(h * scale)))
+    return cv2.resize(img, dsize, interpolation=cv2.INTER_AREA)
+
+class CommandSignals(QtCore.QObject):
+    """
+    @brief Signals emitted by a CommandRunner, delivered on the GUI thread.
+    """
+    finished = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(object, str)
+
+class CommandRunner(QtCore.QRunnable):
+    """
+    @brief Runs the compute step of an image command on a worker thread.
+
+    The result stays cached on the command; the controller shows it when
+    the finished signal arrives.
+    """
+
+    def __init__(self, cmd):
+        """
+        @brief Initializes the runner with the command to compute.
+
+        @param cmd: The image command whose compute() is run.
+        """
+        super(CommandRunner, self).__init__()
+        self.cmd = cmd
+        self.signals = CommandSignals()
+
+    def run(self):
+        """
+        @brief Computes the command and reports the outcome through the signals.
+        """
+        try:
+            self.cmd.compute()
+        except Exception as e:
+            self.signals.failed.emit(self.cmd, str(e))
+        else:
+            self.signals.finished.emit(self.cmd)
+
 class MainWindowController(QMainWindow, Ui_MainWindow):
     """
     @brief Main window controller for the image processing application.
@@ -41,16 +101,103 @@ class MainWindowController(QMainWindow, Ui_MainWindow):
         self.img_output = None
         self.source_path = None
         self.history = CommandHistory()
-
-        # Set scalable image panels
-        self.lblSourceImage.setScaledContents(True)
-        self.lblOutputImage.setScaledContents(True)
+        # Commands run one at a time on a private pool, since Qt itself uses the
+        # global pool (e.g. for smooth pixmap scaling); later clicks wait here.
+        # A single thread is also what makes numba's workqueue layer (main.py) safe.
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pending = deque()
+        self._runner = None
+
+        # Pixmaps of the displayed images; resizing only rescales these
+        self._src_pix = None
+        self._out_pix = None
+        # Label size and transformation mode of the last blit, per label
+        self._blit_state = {}
+        # Bursts of resize events are coalesced into one fast redraw;
+        # a smooth pass follows once resizing stops
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._do_resize_redraw)
+        self._smooth_timer = QtCore.QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(150)
+        self._smooth_timer.timeout.connect(self._redraw_smooth)
+
+        # Set scalable image panels; _blit scales the pixmaps, so the labels only center them
+        self.lblSourceImage.setAlignment(QtCore.Qt.AlignCenter)
+        self.lblOutputImage.setAlignment(QtCore.Qt.AlignCenter)
         self.lblSourceImage.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
         self.lblOutputImage.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
 
+        # Controls that depend on a source or an output image, toggled together.
+        # Groups keep the per-action state, so undo/redo can still be set individually.
+        self._source_group = self._action_group(
+            self.actionClearSource, self.actionExportSource,
+            self.actionRGB2Gray, self.actionRGB2HSV,
+            self.actionMultiOtsu, self.actionChanVese, self.actionMorphSnakes,
+            self.actionEdgeRoberts, self.actionEdgeSobel,
+            self.actionEdgeScharr, self.actionEdgePrewitt
+        )
+        self._source_widgets = (
+            self.btnClearSource, self.btnExportSource,
+            self.groupBoxConversion, self.groupBoxEdgeDetection_2, self.groupBoxEdgeDetection
+        )
+        self._output_group = self._action_group(
+            self.actionSaveOutput, self.actionSaveAsOutput,
+            self.actionExportOutput, self.actionClearOutput,
+            self.actionUndoOutput, self.actionRedoOutput
+        )
+        # Controls toggled individually, built once
+        self._open_ctrls = (self.btnOpenSource, self.actionOpenSource)
+        self._busy_ctrls = self._open_ctrls + (self.btnClearSource, self.actionClearSource)
+        self._clear_output_ctrls = (self.btnClearOutput, self.actionClearOutput)
+        self._undo_ctrls = (self.btnUndoOutput, self.actionUndoOutput)
+        self._redo_ctrls = (self.btnRedoOutput, self.actionRedoOutput)
+
+        # Last (can_undo, can_redo) applied to the undo/redo controls
+        self._last_uredo = (None, None)
+
         self._connect_signals()
         self._set_initial_state()
 
+    def _action_group(self, *actions):
+        """
+        @brief Creates a non-exclusive action group holding the given actions.
+
+        The actions are enabled individually, so that their state follows the group
+        instead of the disabled state set in the designer file.
+
+        @param actions: The actions to be grouped.
+        @return: The QActionGroup.
+        """
+        group = QActionGroup(self)
+        group.setExclusive(False)
+        for action in actions:
+            group.addAction(action)
+            action.setEnabled(True)
+        return group
+
+    def _set_source_controls_enabled(self, enabled):
+        """
+        @brief Enables or disables the controls that need a source image.
+
+        @param enabled: True to enable the controls.
+        """
+        self._source_group.setEnabled(enabled)
+        for widget in self._source_widgets:
+            widget.setEnabled(enabled)
+
+    def _set_output_controls_enabled(self, enabled):
+        """
+        @brief Enables or disables the controls that need an output image.
+
+        @param enabled: True to enable the controls.
+        """
+        self._output_group.setEnabled(enabled)
+        self.groupBoxOutput.setEnabled(enabled)
+
     def resizeEvent(self, event):
         """
         @brief Handles window resizing events.
@@ -58,10 +205,41 @@ class MainWindowController(QMainWindow, Ui_MainWindow):
         @param event: The resize event.
         """
         super(MainWindowController, self).resizeEvent(event)
-        if self.img_source is not None:
-            self._show_image(self.img_source, self.lblSourceImage)
-        if self.img_output is not None:
-            self._show_image(self.img_output, self.lblOutputImage)
+        self._resize_timer.start()
+
+    def _do_resize_redraw(self):
+        """
+        @brief Redraws both panels with fast scaling after a burst of resize events.
+        """
+        self._redraw(QtCore.Qt.FastTransformation)
+        self._smooth_timer.start()
+
+    def _redraw(self, mode):
+        """
+        @brief Rescales the cached pixmaps to the current size of their labels.
+
+        Labels already drawn at their current size, with this mode or with smooth
+        scaling, are left as they are.
+
+        @param mode: The Qt transformation mode used for scaling.
+        """
+        for img, pix, label in (
+            (self.img_source, self._src_pix, self.lblSourceImage),
+            (self.img_output, self._out_pix, self.lblOutputImage)
+        ):
+            if img is None or pix is None:
+                continue
+            if self._blit_state.get(label) in (
+                (label.size(), mode), (label.size(), QtCore.Qt.SmoothTransformation)
+            ):
+                continue
+            self._blit(pix, label, mode)
+
+    def _redraw_smooth(self):
+        """
+        @brief Redraws both panels with smooth scaling once resizing has settled.
+        """
+        self._redraw(QtCore.Qt.SmoothTransformation)
 
     def _set_initial_state(self):
         """
@@ -70,41 +248,18 @@ class MainWindowController(QMainWindow, Ui_MainWindow):
         Initially, only the "Open Source" button is enabled. Other controls are disabled until
         a source image is loaded.
         """
-        for ctrl in (
-            self.btnOpenSource, self.actionOpenSource,
-        ):
+        for ctrl in self._open_ctrls:
             ctrl.setEnabled(True)
         self._disable_output_controls()
 
         # Disable all other controls
-        for ctrl in (
-            self.btnClearSource, self.actionClearSource,
-            self.btnExportSource, self.actionExportSource,
-            self.btnRGB2Gray, self.actionRGB2Gray,
-            self.btnRGB2HSV, self.actionRGB2HSV,
-            self.btnMultiOtsu, self.actionMultiOtsu,
-            self.btnChanVese, self.actionChanVese,
-            self.btnMorphSnakes, self.actionMorphSnakes,
-            self.btnEdgeRoberts, self.actionEdgeRoberts,
-            self.btnEdgeSobel, self.actionEdgeSobel,
-            self.btnEdgeScharr, self.actionEdgeScharr,
-            self.btnEdgePrewitt, self.actionEdgePrewitt
-        ):
-            ctrl.setEnabled(False)
+        self._set_source_controls_enabled(False)
 
     def _disable_output_controls(self):
         """
         @brief Disables output controls when there is no output image.
         """
-        for ctrl in (
-            self.btnSaveOutput, self.actionSaveOutput,
-            self.btnSaveAsOutput, self.actionSaveAsOutput,
-            self.btnExportOutput, self.actionExportOutput,
-            self.btnClearOutput, self.actionClearOutput,
-            self.btnUndoOutput, self.actionUndoOutput,
-            self.btnRedoOutput, self.actionRedoOutput
-        ):
-            ctrl.setEnabled(False)
+        self._set_output_controls_enabled(False)
 
     def _connect_signals(self):
         """
@@ -170,20 +325,7 @@ class MainWindowController(QMainWindow, Ui_MainWindow):
             self._show_image(self.img_source, self.lblSourceImage)
 
             # Enable source processing controls
-            for ctrl in (
-                self.btnClearSource, self.actionClearSource,
-                self.btnExportSource, self.actionExportSource,
-                self.btnRGB2Gray, self.actionRGB2Gray,
-                self.btnRGB2HSV, self.actionRGB2HSV,
-                self.btnMultiOtsu, self.actionMultiOtsu,
-                self.btnChanVese, self.actionChanVese,
-                self.btnMorphSnakes, self.actionMorphSnakes,
-                self.btnEdgeRoberts, self.actionEdgeRoberts,
-                self.btnEdgeSobel, self.actionEdgeSobel,
-                self.btnEdgeScharr, self.actionEdgeScharr,
-                self.btnEdgePrewitt, self.actionEdgePrewitt
-            ):
-                ctrl.setEnabled(True)
+            self._set_source_controls_enabled(True)
 
             # Disable output controls initially
             self._disable_output_controls()
@@ -195,17 +337,16 @@ class MainWindowController(QMainWindow, Ui_MainWindow):
         @brief Saves the processed output image to a file.
 
         This function saves the output image to a file, generating a unique name if necessary.
+        The name gets the index after the highest one already used next to the source file.
         """
         if not self.source_path or self.img_output is None:
             return
         base, ext = os.path.splitext(self.source_path)
-        i = 1
-        while True:
-            candidate = f"{base}_{i}{ext}"
-            if not os.path.exists(candidate):
-                out_path = candidate
-                break
-            i += 1
+        # One directory scan finds the highest existing index instead of probing each name
+        pattern = re.compile(re.escape(os.path.basename(base)) + r"_(\d+)" + re.escape(ext) + "$")
+        with os.scandir(os.path.dirname(base) or ".") as entries:
+            nums = [int(m.group(1)) for e in entries if (m := pattern.match(e.name))]
+        out_path = f"{base}_{max(nums) + 1 if nums else 1}{ext}"
         save_image(self.img_output, out_path)
 
     def save_as_output(self):
@@ -296,51 +437,109 @@ class MainWindowController(QMainWindow, Ui_MainWindow):
         Re-applies the last undone command from the history.
         """
         self.history.redo()
-        if self.img_output is None or not self.history._redo_stack:
-            self.btnRedoOutput.setEnabled(False)
-            self.actionRedoOutput.setEnabled(False)
-        else:
-            self.btnRedoOutput.setEnabled(True)
-            self.actionRedoOutput.setEnabled(True)
+        self._set_undo_redo_enabled(
+            bool(self.history._undo_stack),
+            self.img_output is not None and bool(self.history._redo_stack)
+        )
 
     def _update_undo_redo_buttons(self):
         """
         @brief Updates the enable/disable state of undo/redo buttons based on the command history.
         """
-        can_undo = bool(self.history._undo_stack)
-        can_redo = bool(self.history._redo_stack)
-        for ctrl in (self.btnUndoOutput, self.actionUndoOutput):
+        self._set_undo_redo_enabled(bool(self.history._undo_stack), bool(self.history._redo_stack))
+
+    def _set_undo_redo_enabled(self, can_undo, can_redo):
+        """
+        @brief Enables or disables the undo and redo controls.
+
+        The last state is remembered, so the controls are only touched when it changes.
+
+        @param can_undo: True to enable the undo controls.
+        @param can_redo: True to enable the redo controls.
+        """
+        if (can_undo, can_redo) == self._last_uredo:
+            return
+        self._last_uredo = (can_undo, can_redo)
+        for ctrl in self._undo_ctrls:
             ctrl.setEnabled(can_undo)
-        for ctrl in (self.btnRedoOutput, self.actionRedoOutput):
+        for ctrl in self._redo_ctrls:
             ctrl.setEnabled(can_redo)
 
     def _apply(self, CmdClass):
         """
         @brief Applies a specific image processing command.
 
-        Executes the specified command and updates the output image and relevant controls.
+        Queues the specified command; it is computed on the thread pool after the commands
+        queued before it, then its output image is shown and the relevant controls are updated.
 
         @param CmdClass: The command class to be applied.
         """
         if self.img_source is None:
             return
-        cmd = CmdClass(self)
+        self._pending.append(CmdClass)
+        if self._runner is None:
+            self._start_next()
+
+    def _start_next(self):
+        """
+        @brief Starts the next queued command on the thread pool.
+
+        The command is created only when it starts, so that it records the output
+        of the previous command for undo.
+        """
+        if not self._pending:
+            self._runner = None
+            self._set_busy(False)
+            return
+        self._set_busy(True)
+        self._runner = CommandRunner(self._pending.popleft()(self))
+        self._runner.signals.finished.connect(self._on_command_finished)
+        self._runner.signals.failed.connect(self._on_command_failed)
+        self._pool.start(self._runner)
+
+    def _on_command_finished(self, cmd):
+        """
+        @brief Shows the result of a computed command and records it in the history.
+
+        @param cmd: The command whose result was computed.
+        """
         self.history.push(cmd)
         cmd.execute()
-        self.img_output = cmd.ctrl.img_output if hasattr(cmd, 'ctrl') else None
 
         # Enable output controls
-        for ctrl in (
-            self.btnSaveOutput, self.actionSaveOutput,
-            self.btnSaveAsOutput, self.actionSaveAsOutput,
-            self.btnExportOutput, self.actionExportOutput,
-            self.btnClearOutput, self.actionClearOutput,
-            self.btnUndoOutput, self.actionUndoOutput
-        ):
+        self._set_output_controls_enabled(True)
+        for ctrl in self._clear_output_ctrls:
             ctrl.setEnabled(True)
 
         # Update redo state
         self._update_undo_redo_buttons()
+        self._start_next()
+
+    def _on_command_failed(self, cmd, msg):
+        """
+        @brief Reports a command that failed to compute and moves on to the next one.
+
+        @param cmd: The command that failed.
+        @param msg: The error message.
+        """
+        show_error(msg)
+        self._start_next()
+
+    def _set_busy(self, busy):
+        """
+        @brief Locks the controls that change the images or the history while a command runs.
+
+        @param busy: True while a command is running.
+        """
+        for ctrl in self._busy_ctrls:
+            ctrl.setEnabled(not busy)
+        has_output = not busy and self.img_output is not None
+        for ctrl in self._clear_output_ctrls:
+            ctrl.setEnabled(has_output)
+        if has_output:
+            self._update_undo_redo_buttons()
+        else:
+            self._set_undo_redo_enabled(False, False)
 
     # Conversion / Segmentation / Edge Detection method bindings
     apply_grayscale   = lambda self: self._apply(GrayscaleCommand)
@@ -357,25 +556,64 @@ class MainWindowController(QMainWindow, Ui_MainWindow):
         """
         @brief Displays the image in the specified label.
 
-        This method converts the image to an appropriate format and scales it to fit the label.
+        This method converts the image to a pixmap, caches it for later resizes
+        and scales it to fit the label. A None image clears the label.
 
         @param array: The image array to be displayed.
         @param label: The QLabel where the image will be shown.
         """
-        img = array.astype(np.float64)
+        pix = self._array_to_pixmap(array) if array is not None else None
+        if label is self.lblSourceImage:
+            self._src_pix = pix
+        else:
+            self._out_pix = pix
+        if pix is None:
+            label.clear()
+        else:
+            self._blit(pix, label)
+
+    def _blit(self, pix, label, mode=QtCore.Qt.SmoothTransformation):
+        """
+        @brief Scales a pixmap to fit the label, keeping its aspect ratio.
+
+        @param pix: The cached pixmap.
+        @param label: The QLabel where the pixmap will be shown.
+        @param mode: The Qt transformation mode used for scaling.
+        """
+        label.setPixmap(pix.scaled(label.size(), QtCore.Qt.KeepAspectRatio, mode))
+        self._blit_state[label] = (label.size(), mode)
+
+    def _array_to_pixmap(self, array):
+        """
+        @brief Converts an image array to a display-sized QPixmap.
+
+        uint8 images are used as they are; other types are converted to uint8
+        by OpenCV in a single pass, without a floating-point copy. Images larger
+        than _MAX_DISPLAY_DIM are downscaled, so later rescales stay cheap; the
+        array itself, used for processing and saving, keeps its full resolution.
+
+        @param array: The image array to be converted.
+        @return: The QPixmap of the image.
+        """
+        if array.dtype == np.uint8:
+            img = array
+        elif array.ndim == 2:
+            # Stretch the intensity range to 0–255 straight into uint8, without a float buffer
+            img = cv2.normalize(array, None, 0, 255, cv2.NORM_MINMAX, cv2.CV_8U)
+        else:
+            # [0, 1] floats are scaled to 8 bits; convertScaleAbs saturates the rest
+            img = cv2.convertScaleAbs(array, alpha=255.0 if array.max() <= 1 else 1.0)
+        img = _downscale_for_display(img)
+        # QImage reads the buffer in place, so it must be C-contiguous and outlive the
+        # QImage; fromImage then makes the pixmap's own copy while img is still alive
+        img = np.ascontiguousarray(img)
         if img.ndim == 2:
-            img -= img.min()
-            if img.max() > 0:
-                img /= img.max()
-            img = (img * 255).astype(np.uint8)
             h, w = img.shape
             qimg = QImage(img.data, w, h, w, QImage.Format_Grayscale8)
         else:
-            if img.max() > 1:
-                img /= 255.0
-            img = np.clip(img, 0, 1)
-            img = (img * 255).astype(np.uint8)
             h, w, ch = img.shape
-            qimg = QImage(img.data, w, h, ch*w, QImage.Format_RGB888)
-        pix = QPixmap.fromImage(qimg)
-        label.setPixmap(pix.scaled(label.size(), QtCore.Qt.KeepAspectRatio))
+            # Qt repacks RGB888 to its native 32-bit format faster than it converts a
+            # padded RGBX8888 buffer; 4-channel images are passed with their alpha
+            fmt = QImage.Format_RGBA8888 if ch == 4 else QImage.Format_RGB888
+            qimg = QImage(img.data, w, h, ch*w, fmt)
+        return QPixmap.fromImage(qimg)
@@ -1,25 +1,43 @@
 # utils.py
+import os
 from PyQt5.QtWidgets import QMessageBox
-from skimage import io
+import cv2
 import numpy as np
 
+# PNG compression level and JPEG quality used by save_image
+_WRITE_PARAMS = {
+    '.png': [cv2.IMWRITE_PNG_COMPRESSION, 3],
+    '.jpg': [cv2.IMWRITE_JPEG_QUALITY, 92],
+    '.jpeg': [cv2.IMWRITE_JPEG_QUALITY, 92],
+}
+
 def open_image(path: str) -> np.ndarray:
     """
     @brief Opens an image from the specified file path.
 
     This function reads an image from the given file path and converts it to a NumPy array.
     If the image is in float format, it will be scaled to the [0, 255] range and cast to uint8.
+    Images are decoded with OpenCV; files it cannot read fall back to scikit-image.
     
     @param path: The file path of the image to be opened.
     @return: A NumPy array representing the image.
     @throws IOError: If the image cannot be opened from the specified path.
     """
-    img = io.imread(path)
+    img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+    if img is None:
+        # scikit-image is only imported for the files OpenCV cannot decode
+        from skimage import io
+        img = io.imread(path)
+    elif img.ndim == 3 and img.shape[2] in (3, 4):
+        # OpenCV decodes to BGR(A); the rest of the application works in RGB(A)
+        code = cv2.COLOR_BGRA2RGBA if img.shape[2] == 4 else cv2.COLOR_BGR2RGB
+        img = cv2.cvtColor(img, code)
     if img is None:
         raise IOError(f"Cannot open image: {path}")
     # Convert to uint8 if the image is in float [0–1] format
     if img.dtype == np.float64 or img.dtype == np.float32:
-        img = (img * 255).astype(np.uint8)
+        # Scales, rounds and saturates in one pass without a float64 temporary
+        img = cv2.convertScaleAbs(img, alpha=255.0)
     # Keep the 2D array if the image is grayscale, else return [H, W, 3] uint8 for color images
     return img
 
@@ -28,14 +46,27 @@ def save_image(img: np.ndarray, path: str):
     @brief Saves the given image to the specified file path.
 
     This function attempts to save the NumPy array image to the given path. If an error occurs, it raises
-    an IOError with the specific error message.
+    an IOError with the specific error message. Images are encoded with OpenCV; formats it refuses
+    fall back to scikit-image.
 
     @param img: The image to be saved, represented as a NumPy array.
     @param path: The destination file path where the image will be saved.
     @throws IOError: If the image cannot be saved to the specified path.
     """
     try:
-        io.imsave(path, img)
+        out = img
+        if img.ndim == 3 and img.shape[2] in (3, 4):
+            # OpenCV encodes from BGR(A); the rest of the application works in RGB(A)
+            code = cv2.COLOR_RGBA2BGRA if img.shape[2] == 4 else cv2.COLOR_RGB2BGR
+            out = cv2.cvtColor(np.ascontiguousarray(img), code)
+        try:
+            params = _WRITE_PARAMS.get(os.path.splitext(path)[1].lower(), [])
+            ok = cv2.imwrite(path, out, params)
+        except cv2.error:
+            ok = False
+        if not ok:
+            from skimage import io
+            io.imsave(path, img)
     except Exception as e:
         raise IOError(f"Failed to save image: {path}\n{e}")
 
@@ -50,16 +81,22 @@ def export_image(img: np.ndarray, path: str):
     """
     save_image(img, path)
 
+# Error dialog reused by show_error; created on first use, once a QApplication exists
+_err_dlg = None
+
 def show_error(msg: str):
     """
     @brief Displays an error message in a popup window.
 
-    This function creates a message box with a critical error icon and the provided message text.
+    This function shows a message box with a critical error icon and the provided message text.
+    The message box is created on the first call and reused afterwards.
 
     @param msg: The error message to be displayed in the message box.
     """
-    dlg = QMessageBox()
-    dlg.setIcon(QMessageBox.Critical)
-    dlg.setWindowTitle("Error")
-    dlg.setText(msg)
-    dlg.exec_()
+    global _err_dlg
+    if _err_dlg is None:
+        _err_dlg = QMessageBox()
+        _err_dlg.setIcon(QMessageBox.Critical)
+        _err_dlg.setWindowTitle("Error")
+    _err_dlg.setText(msg)
+    _err_dlg.exec_()